@@ -4,16 +4,19 @@ ASX RBA Rate Tracker API Proxy
 Fetches real-time market probabilities from ASX and serves them via API
 """
 
-import json
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import pytz
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
 from flask_cors import CORS
 import re
+import time
+from dataclasses import replace
 from typing import Dict, List, Optional
 
+from models import Outcome, Snapshot
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
@@ -22,6 +25,9 @@ TIMEZONE = pytz.timezone('Australia/Sydney')
 ASX_RATE_TRACKER_URL = "https://www.asx.com.au/data/trt/ib_expectation_curve_graph.pdf"
 # Note: The actual URL might be different - this needs to be verified
 
+# How long a fetched snapshot is served before ASX is queried again
+SNAPSHOT_TTL_SECONDS = 300
+
 class ASXRateTracker:
     """Fetches and parses ASX RBA Rate Tracker data"""
     
@@ -31,10 +37,10 @@ class ASXRateTracker:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
     
-    def fetch_rate_probabilities(self) -> Optional[Dict]:
+    def fetch_rate_probabilities(self) -> Optional[Snapshot]:
         """
         Fetch current market probabilities from ASX
-        Returns dict with probabilities for each rate outcome
+        Returns a snapshot with probabilities for each rate outcome
         """
         try:
             # Note: The actual implementation would depend on the ASX page structure
@@ -63,19 +69,19 @@ class ASXRateTracker:
             # Get next meeting date
             meeting_date = self._extract_meeting_date(soup)
             
-            return {
-                'nextMeeting': meeting_date,
-                'source': 'ASX RBA Rate Tracker',
-                'lastUpdate': datetime.now(TIMEZONE).isoformat(),
-                'probabilities': probabilities
-            }
+            return Snapshot.create(
+                next_meeting=meeting_date,
+                source='ASX RBA Rate Tracker',
+                last_update=datetime.now(TIMEZONE).isoformat(),
+                probabilities=probabilities
+            )
             
         except Exception as e:
             print(f"Error fetching ASX data: {e}")
             # Return fallback data or cached data
             return self._get_fallback_data()
     
-    def _parse_probability_table(self, table_element) -> List[Dict]:
+    def _parse_probability_table(self, table_element) -> List[Outcome]:
         """Parse the probability table from HTML"""
         probabilities = []
         
@@ -98,15 +104,7 @@ class ASXRateTracker:
                     if prob_match:
                         probability = float(prob_match.group(1))
                         
-                        # Calculate implied odds
-                        implied_odds = 100 / probability if probability > 0 else 0
-                        
-                        probabilities.append({
-                            'outcome': outcome_text,
-                            'rate': rate,
-                            'probability': probability,
-                            'impliedOdds': round(implied_odds, 2)
-                        })
+                        probabilities.append(Outcome(outcome_text, rate, probability))
         
         return probabilities
     
@@ -134,27 +132,9 @@ class ASXRateTracker:
         # Default to next known meeting
         return "2025-07-08"
     
-    def _get_fallback_data(self) -> Dict:
+    def _get_fallback_data(self) -> Snapshot:
         """Return fallback data if scraping fails"""
-        return {
-            'nextMeeting': '2025-07-08',
-            'source': 'ASX RBA Rate Tracker (Cached)',
-            'lastUpdate': datetime.now(TIMEZONE).isoformat(),
-            'probabilities': [
-                {
-                    'outcome': 'Hold (3.85%)',
-                    'rate': 3.85,
-                    'probability': 3,
-                    'impliedOdds': 33.33
-                },
-                {
-                    'outcome': '-0.25% (3.60%)',
-                    'rate': 3.60,
-                    'probability': 97,
-                    'impliedOdds': 1.03
-                }
-            ]
-        }
+        return Snapshot.create_fallback('2025-07-08', datetime.now(TIMEZONE).isoformat())
 
 # Alternative: Direct JSON API approach (if ASX provides one)
 class ASXRateTrackerAPI:
@@ -165,7 +145,7 @@ class ASXRateTrackerAPI:
         self.api_base = "https://www.asx.com.au/asx/api/v1"
         self.rate_tracker_endpoint = "/derivatives/rate-tracker"
     
-    def fetch_rate_probabilities(self) -> Optional[Dict]:
+    def fetch_rate_probabilities(self) -> Optional[Snapshot]:
         """Fetch from API endpoint"""
         try:
             url = f"{self.api_base}{self.rate_tracker_endpoint}"
@@ -175,22 +155,21 @@ class ASXRateTrackerAPI:
             data = response.json()
             
             # Transform API response to our format
-            probabilities = []
-            for outcome in data.get('outcomes', []):
-                prob = outcome.get('probability', 0)
-                probabilities.append({
+            probabilities = [
+                Outcome.from_dict({
                     'outcome': outcome.get('description'),
                     'rate': outcome.get('target_rate'),
-                    'probability': prob,
-                    'impliedOdds': round(100 / prob, 2) if prob > 0 else 0
+                    'probability': outcome.get('probability', 0)
                 })
+                for outcome in data.get('outcomes', [])
+            ]
             
-            return {
-                'nextMeeting': data.get('next_meeting_date'),
-                'source': 'ASX RBA Rate Tracker API',
-                'lastUpdate': datetime.now(TIMEZONE).isoformat(),
-                'probabilities': probabilities
-            }
+            return Snapshot.create(
+                next_meeting=data.get('next_meeting_date'),
+                source='ASX RBA Rate Tracker API',
+                last_update=datetime.now(TIMEZONE).isoformat(),
+                probabilities=probabilities
+            )
             
         except Exception as e:
             print(f"API Error: {e}")
@@ -200,19 +179,37 @@ class ASXRateTrackerAPI:
 tracker = ASXRateTracker()
 api_tracker = ASXRateTrackerAPI()
 
-@app.route('/api/rba-probabilities')
-def get_rba_probabilities():
-    """API endpoint to get current RBA rate probabilities"""
+# Most recently served snapshot and the time it was fetched
+_latest_snapshot: Optional[Snapshot] = None
+_latest_fetched_at = 0.0
+
+def get_latest_snapshot() -> Optional[Snapshot]:
+    """Return the current snapshot, refetching once it is older than the TTL"""
+    global _latest_snapshot, _latest_fetched_at
+    
+    if _latest_snapshot and time.monotonic() - _latest_fetched_at < SNAPSHOT_TTL_SECONDS:
+        return _latest_snapshot
     
     # Try API first, fall back to scraping
-    data = api_tracker.fetch_rate_probabilities()
-    if not data:
-        data = tracker.fetch_rate_probabilities()
+    snapshot = api_tracker.fetch_rate_probabilities()
+    if not snapshot:
+        snapshot = tracker.fetch_rate_probabilities()
     
-    if data:
+    if snapshot:
         # Add historical comparison if available
-        data['changes'] = calculate_daily_changes(data)
-        return jsonify(data)
+        _latest_snapshot = replace(snapshot, changes=calculate_daily_changes(snapshot))
+        _latest_fetched_at = time.monotonic()
+    
+    return _latest_snapshot
+
+@app.route('/api/rba-probabilities')
+def get_rba_probabilities():
+    """API endpoint to get current RBA rate probabilities"""
+    snapshot = get_latest_snapshot()
+    
+    if snapshot:
+        # The snapshot caches its encoded JSON, so repeat requests skip encoding
+        return Response(snapshot.to_json(), mimetype='application/json')
     else:
         return jsonify({'error': 'Unable to fetch data'}), 500
 
@@ -258,7 +255,7 @@ def get_probability_history():
         ]
     })
 
-def calculate_daily_changes(current_data: Dict) -> Dict:
+def calculate_daily_changes(current_data: Snapshot) -> Dict:
     """Calculate changes from previous day"""
     # This would compare with yesterday's stored data
     # For demo, return sample changes
@@ -271,12 +268,12 @@ def calculate_daily_changes(current_data: Dict) -> Dict:
 # Scheduled task to cache data
 def cache_daily_data():
     """Run daily to cache probability data"""
-    data = tracker.fetch_rate_probabilities()
-    if data:
+    snapshot = tracker.fetch_rate_probabilities()
+    if snapshot:
         # Store in database or file
         filename = f"data/prob_history_{datetime.now().strftime('%Y%m%d')}.json"
-        with open(filename, 'w') as f:
-            json.dump(data, f)
+        with open(filename, 'wb') as f:
+            f.write(snapshot.to_json())
 
 if __name__ == '__main__':
     # For production, use a proper WSGI server like Gunicorn
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+RBA Market Odds Backtester
+Scores stored ASX probability snapshots against actual RBA decisions
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from datetime import datetime, time, timezone
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytz
+
+from models import Meeting, Snapshot, load_meetings
+
+# Configuration
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+TIMEZONE = pytz.timezone('Australia/Sydney')
+SNAPSHOT_PATTERN = 'prob_history_*.json'
+ARCHIVE_FILENAME = 'prob_history.parquet'
+
+# Parquet metadata key listing the snapshot files an archive was built from
+SOURCES_METADATA_KEY = b'sources'
+
+# Announcement times come from meetings.json; meetings that have rolled off
+# the calendar fall back to the usual 2:30 PM Sydney time
+DEFAULT_ANNOUNCEMENT_TIME = pd.Timedelta(hours=14, minutes=30)
+
+# Snapshots per Parquet row group - each group is scored independently, so
+# this bounds how much of the archive is held in memory at once
+SNAPSHOTS_PER_ROW_GROUP = 5000
+
+# Probabilities are clipped away from zero before taking logs
+LOG_LOSS_EPSILON = 1e-6
+
+ARCHIVE_SCHEMA = pa.schema([
+    ('snapshot_id', pa.int64()),
+    ('snapshot_time', pa.timestamp('s', tz='UTC')),
+    ('meeting_date', pa.timestamp('s')),
+    ('rate', pa.float64()),
+    ('probability', pa.float64())
+])
+
+
+def _snapshot_time(snapshot: Snapshot) -> datetime:
+    """A snapshot's lastUpdate as a UTC timestamp (naive means Sydney)"""
+    parsed = snapshot.updated_at
+    if parsed.tzinfo is None:
+        parsed = TIMEZONE.localize(parsed)
+    return parsed.astimezone(timezone.utc)
+
+
+def snapshot_files(data_dir: str = DATA_DIR) -> List[str]:
+    """Sorted paths of the stored prob_history files"""
+    return sorted(glob.glob(os.path.join(data_dir, SNAPSHOT_PATTERN)))
+
+
+def iter_snapshots(paths: List[str]) -> Iterator[Snapshot]:
+    """Yield validated market snapshots from prob_history files, one file at a time"""
+    for path in paths:
+        try:
+            with open(path, 'r') as f:
+                snapshot = Snapshot.from_dict(json.load(f))
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Skipping {os.path.basename(path)}: {e}")
+            continue
+
+        # Canned data saved when a fetch failed says nothing about the market
+        if snapshot.fallback:
+            print(f"Skipping {os.path.basename(path)}: fallback data")
+            continue
+        yield snapshot
+
+
+def archive_is_stale(archive_path: str, data_dir: str = DATA_DIR) -> bool:
+    """
+    True if the archive needs rebuilding
+    That is when it is missing or unreadable, was built from a different set of
+    snapshot files, or is older than any of them.
+    """
+    if not os.path.exists(archive_path):
+        return True
+    try:
+        metadata = pq.read_schema(archive_path).metadata or {}
+        archived_sources = json.loads(metadata[SOURCES_METADATA_KEY])
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return True
+
+    paths = snapshot_files(data_dir)
+    if archived_sources != [os.path.basename(path) for path in paths]:
+        return True
+    archived_at = os.path.getmtime(archive_path)
+    return any(os.path.getmtime(path) > archived_at for path in paths)
+
+
+def build_archive(archive_path: str, data_dir: str = DATA_DIR) -> int:
+    """
+    Convert the stored JSON snapshots into a columnar Parquet archive
+    Writes one row per outcome, flushing a row group every SNAPSHOTS_PER_ROW_GROUP
+    snapshots so the source files never need to be held in memory together.
+    The archive is built beside the target and moved into place on success, so
+    an interrupted build never leaves a partial archive behind.
+    Returns the number of snapshots archived.
+    """
+    paths = snapshot_files(data_dir)
+    sources = json.dumps([os.path.basename(path) for path in paths])
+    schema = ARCHIVE_SCHEMA.with_metadata({SOURCES_METADATA_KEY: sources.encode('utf-8')})
+    temp_path = archive_path + '.tmp'
+
+    try:
+        count = _write_archive(temp_path, schema, paths)
+        os.replace(temp_path, archive_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    print(f"Archived {count} snapshots to {archive_path}")
+    return count
+
+
+def _write_archive(path: str, schema: pa.Schema, paths: List[str]) -> int:
+    """Write the snapshots from paths to a Parquet file, returning how many were written"""
+    columns = {name: [] for name in schema.names}
+    count = 0
+
+    with pq.ParquetWriter(path, schema) as writer:
+        for snapshot in iter_snapshots(paths):
+            taken_at = _snapshot_time(snapshot)
+            meeting = datetime.combine(snapshot.meeting_date, time.min)
+
+            # Normalise the rounded percentages to a distribution summing to 1
+            total = sum(p.probability for p in snapshot.probabilities)
+            for outcome in snapshot.probabilities:
+                columns['snapshot_id'].append(count)
+                columns['snapshot_time'].append(taken_at)
+                columns['meeting_date'].append(meeting)
+                columns['rate'].append(outcome.rate)
+                columns['probability'].append(outcome.probability / total)
+            count += 1
+
+            if count % SNAPSHOTS_PER_ROW_GROUP == 0:
+                writer.write_table(pa.table(columns, schema=schema))
+                columns = {name: [] for name in schema.names}
+
+        if columns['snapshot_id']:
+            writer.write_table(pa.table(columns, schema=schema))
+
+    return count
+
+
+def iter_archive(archive_path: str) -> Iterator[pd.DataFrame]:
+    """Stream the archive from disk one row group at a time"""
+    archive = pq.ParquetFile(archive_path)
+    for i in range(archive.num_row_groups):
+        yield archive.read_row_group(i).to_pandas()
+
+
+def announcement_calendar(meetings: List[Meeting]) -> pd.Series:
+    """Map each meeting day to its UTC announcement time"""
+    calendar = pd.Series(pd.to_datetime([m.announced_at for m in meetings], utc=True),
+                         index=pd.DatetimeIndex([pd.Timestamp(m.day) for m in meetings]))
+    return calendar[~calendar.index.duplicated(keep='last')]
+
+
+def announcement_times(meeting_dates: pd.DatetimeIndex, calendar: pd.Series) -> pd.Series:
+    """UTC announcement time of each meeting, from the calendar where it is listed"""
+    default = (meeting_dates + DEFAULT_ANNOUNCEMENT_TIME).tz_localize(
+        TIMEZONE, ambiguous='NaT', nonexistent='NaT').tz_convert('UTC')
+    listed = calendar.reindex(meeting_dates)
+    return listed.where(listed.notna(), pd.Series(default, index=meeting_dates))
+
+
+def resolve_decisions(meeting_dates: pd.DatetimeIndex, announced_at: pd.Series,
+                      rate_history: Dict, as_of: Optional[pd.Timestamp] = None) -> pd.Series:
+    """
+    Look up the cash rate decided at each meeting
+    Uses the month-end rates in rate-history.json, then lastChange for meetings
+    after the monthly series ends. Meetings the data does not cover - after
+    max(series end, lastChange date), or not yet announced at as_of - map to NaN.
+    """
+    if as_of is None:
+        as_of = pd.Timestamp.now(tz='UTC')
+
+    historical = pd.DataFrame(rate_history.get('historical', []), columns=['date', 'rate'])
+    monthly = pd.Series(historical['rate'].to_numpy(dtype=float),
+                        index=pd.PeriodIndex(historical['date'], freq='M'))
+    monthly = monthly[~monthly.index.duplicated(keep='last')]
+
+    months = meeting_dates.to_period('M')
+    decided = monthly.reindex(months).to_numpy()
+
+    last_change = rate_history.get('lastChange')
+    series_end = monthly.index.max() if len(monthly) else None
+    change_date = pd.Timestamp(last_change['date']) if last_change else None
+    if change_date is not None and (series_end is None or change_date.to_period('M') > series_end):
+        # Between the series end and lastChange the rate is only known if the
+        # series already stood at previousRate, i.e. lastChange was the only move
+        held = series_end is not None and np.isclose(monthly.iloc[-1], last_change['previousRate'])
+        after_series = months > series_end if series_end is not None else np.ones(len(months), bool)
+        from_change = np.where(meeting_dates == change_date, last_change['newRate'],
+                               np.where((meeting_dates < change_date) & held,
+                                        last_change['previousRate'], np.nan))
+        decided = np.where(after_series, from_change, decided)
+
+    announced = (announced_at.reindex(meeting_dates) <= as_of).to_numpy()
+    decided = np.where(announced, decided, np.nan)
+    return pd.Series(decided, index=meeting_dates, dtype=float)
+
+
+def score_batch(batch: pd.DataFrame, rate_history: Dict, calendar: pd.Series,
+                bins: int, as_of: Optional[pd.Timestamp] = None):
+    """
+    Score one batch of archived outcomes
+    Returns a per-snapshot frame (Brier score, log loss, hit, days before the
+    meeting) and per-bin calibration sums for the batch.
+    """
+    meetings = pd.DatetimeIndex(batch['meeting_date'].unique())
+    announced = announcement_times(meetings, calendar)
+    decisions = resolve_decisions(meetings, announced, rate_history, as_of)
+    actual = batch['meeting_date'].map(decisions)
+
+    announced_at = batch['meeting_date'].map(announced)
+    days_before = (announced_at - batch['snapshot_time']) / pd.Timedelta(days=1)
+
+    # Only score forecasts made before a decision that is already known
+    keep = actual.notna() & (days_before >= 0)
+    batch = batch.loc[keep]
+    actual = actual[keep]
+
+    probability = batch['probability'].to_numpy()
+    happened = (np.round(batch['rate'].to_numpy() * 100) ==
+                np.round(actual.to_numpy() * 100)).astype(float)
+
+    rows = pd.DataFrame({
+        'snapshot_id': batch['snapshot_id'].to_numpy(),
+        'meeting_date': batch['meeting_date'].to_numpy(),
+        'days_before': days_before[keep].to_numpy(),
+        'squared_error': (probability - happened) ** 2,
+        'p_actual': probability * happened,
+        'probability': probability,
+        'happened': happened
+    })
+
+    grouped = rows.groupby('snapshot_id', sort=False)
+    snapshots = grouped.agg(
+        meeting_date=('meeting_date', 'first'),
+        days_before=('days_before', 'first'),
+        brier=('squared_error', 'sum'),
+        p_actual=('p_actual', 'sum'),
+        listed=('happened', 'sum')
+    )
+
+    # The decided rate may not be among a snapshot's outcomes: it was then
+    # forecast at probability 0, adding (0 - 1)^2 to the Brier score and a
+    # realised event to the lowest calibration bin
+    unlisted = 1 - np.minimum(snapshots.pop('listed'), 1)
+    snapshots['brier'] += unlisted
+
+    # Tied favourites share the credit, so the hit does not depend on the
+    # order the outcomes were listed in
+    favourite = np.isclose(probability, grouped['probability'].transform('max').to_numpy())
+    favourites = pd.DataFrame({
+        'snapshot_id': rows['snapshot_id'],
+        'favourite': favourite.astype(float),
+        'favourite_hit': favourite * happened
+    }).groupby('snapshot_id', sort=False).sum().reindex(snapshots.index)
+    snapshots['hit'] = favourites['favourite_hit'] / favourites['favourite']
+    snapshots['log_loss'] = -np.log(np.clip(snapshots['p_actual'], LOG_LOSS_EPSILON, 1.0))
+
+    rows['bin'] = np.minimum((probability * bins).astype(int), bins - 1)
+    calibration = rows.groupby('bin').agg(
+        predicted=('probability', 'sum'),
+        observed=('happened', 'sum'),
+        count=('happened', 'size')
+    )
+    missed = unlisted.sum()
+    calibration = calibration.add(
+        pd.DataFrame({'predicted': 0.0, 'observed': missed, 'count': missed}, index=[0]),
+        fill_value=0
+    )
+
+    return snapshots, calibration
+
+
+def run_backtest(archive_path: str, rate_history: Dict, meetings: List[Meeting],
+                 bins: int = 10, as_of: Optional[pd.Timestamp] = None) -> Dict:
+    """Score every archived snapshot and summarise the results"""
+    if bins < 1:
+        raise ValueError(f"bins must be at least 1, got {bins}")
+    calendar = announcement_calendar(meetings)
+    snapshot_frames = []
+    calibration = None
+
+    for batch in iter_archive(archive_path):
+        snapshots, batch_calibration = score_batch(batch, rate_history, calendar, bins, as_of)
+        snapshot_frames.append(snapshots)
+        calibration = batch_calibration if calibration is None else calibration.add(batch_calibration, fill_value=0)
+
+    scored = pd.concat(snapshot_frames) if snapshot_frames else pd.DataFrame()
+    if scored.empty:
+        return {'snapshots': 0, 'meetings': 0, 'calibration': [], 'daysBefore': []}
+
+    calibration = calibration.reindex(range(bins), fill_value=0)
+    calibration_curve = pd.DataFrame({
+        'binStart': calibration.index / bins,
+        'binEnd': (calibration.index + 1) / bins,
+        'meanPredicted': calibration['predicted'] / calibration['count'].replace(0, np.nan),
+        'observedFrequency': calibration['observed'] / calibration['count'].replace(0, np.nan),
+        'count': calibration['count'].astype(int)
+    })
+
+    scored['days'] = np.floor(scored['days_before']).astype(int)
+    profile = scored.groupby('days').agg(
+        brier=('brier', 'mean'),
+        logLoss=('log_loss', 'mean'),
+        accuracy=('hit', 'mean'),
+        count=('hit', 'size')
+    ).reset_index().rename(columns={'days': 'daysBefore'})
+
+    return {
+        'snapshots': int(len(scored)),
+        'meetings': int(scored['meeting_date'].nunique()),
+        'brier': float(scored['brier'].mean()),
+        'logLoss': float(scored['log_loss'].mean()),
+        'accuracy': float(scored['hit'].mean()),
+        'calibration': _records(calibration_curve),
+        'daysBefore': _records(profile)
+    }
+
+
+def _records(frame: pd.DataFrame) -> List[Dict]:
+    """Convert a frame to JSON-safe records (NaN becomes None)"""
+    return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+
+def print_summary(results: Dict):
+    """Print a readable summary of backtest results"""
+    print(f"\nScored {results['snapshots']} snapshots across {results['meetings']} meetings")
+    if not results['snapshots']:
+        return
+    print(f"Brier score: {results['brier']:.4f}")
+    print(f"Log loss:    {results['logLoss']:.4f}")
+    print(f"Accuracy:    {results['accuracy']:.1%}")
+    print("\nCalibration:")
+    print(pd.DataFrame(results['calibration']).to_string(index=False))
+    print("\nBy days before meeting:")
+    print(pd.DataFrame(results['daysBefore']).to_string(index=False))
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    """Main backtest function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[-1])
+    parser.add_argument('--data-dir', default=DATA_DIR,
+                        help='directory containing prob_history_*.json, rate-history.json and meetings.json')
+    parser.add_argument('--archive', help=f'Parquet archive path (default: <data-dir>/{ARCHIVE_FILENAME})')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the archive even if it is up to date')
+    parser.add_argument('--bins', type=_positive_int, default=10, help='number of calibration bins')
+    parser.add_argument('--output', help='also write the results to this JSON file')
+    args = parser.parse_args()
+
+    archive_path = args.archive or os.path.join(args.data_dir, ARCHIVE_FILENAME)
+
+    try:
+        if args.rebuild or archive_is_stale(archive_path, args.data_dir):
+            build_archive(archive_path, args.data_dir)
+
+        with open(os.path.join(args.data_dir, 'rate-history.json'), 'r') as f:
+            rate_history = json.load(f)
+
+        meetings_path = os.path.join(args.data_dir, 'meetings.json')
+        meetings = []
+        if os.path.exists(meetings_path):
+            with open(meetings_path, 'r') as f:
+                meetings = load_meetings(json.load(f))
+
+        results = run_backtest(archive_path, rate_history, meetings, args.bins)
+        print_summary(results)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nSaved results to {args.output}")
+
+    except Exception as e:
+        print(f"Error during backtest: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
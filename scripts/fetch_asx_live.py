@@ -18,6 +18,8 @@ from webdriver_manager.chrome import ChromeDriverManager
 import re
 import os
 
+from models import Outcome, Snapshot
+
 class ASXSeleniumScraper:
     def __init__(self):
         self.tz = pytz.timezone('Australia/Sydney')
@@ -56,12 +58,16 @@ class ASXSeleniumScraper:
             # Get next meeting date
             meeting_date = self.extract_meeting_date()
             
-            return {
-                'nextMeeting': meeting_date,
-                'source': 'ASX RBA Rate Tracker',
-                'lastUpdate': datetime.now(self.tz).isoformat(),
-                'probabilities': probabilities
-            }
+            # Fallback data if extraction fails
+            if not probabilities:
+                return Snapshot.create_fallback(meeting_date, datetime.now(self.tz).isoformat())
+            
+            return Snapshot.create(
+                next_meeting=meeting_date,
+                source='ASX RBA Rate Tracker',
+                last_update=datetime.now(self.tz).isoformat(),
+                probabilities=probabilities
+            )
             
         except Exception as e:
             print(f"Error fetching data: {e}")
@@ -110,15 +116,7 @@ class ASXSeleniumScraper:
                                     else:
                                         continue
                                 
-                                # Calculate implied odds
-                                implied_odds = 100 / probability if probability > 0 else 0
-                                
-                                probabilities.append({
-                                    'outcome': outcome,
-                                    'rate': rate,
-                                    'probability': probability,
-                                    'impliedOdds': round(implied_odds, 2)
-                                })
+                                probabilities.append(Outcome(outcome, rate, probability))
             
             # If no table found, try alternative selectors
             if not probabilities:
@@ -129,32 +127,10 @@ class ASXSeleniumScraper:
                     probability = float(elem.find_element(By.CLASS_NAME, "probability").text.strip('%'))
                     rate = float(elem.get_attribute('data-rate'))
                     
-                    probabilities.append({
-                        'outcome': outcome,
-                        'rate': rate,
-                        'probability': probability,
-                        'impliedOdds': round(100 / probability, 2) if probability > 0 else 0
-                    })
+                    probabilities.append(Outcome(outcome, rate, probability))
             
         except Exception as e:
             print(f"Error extracting probabilities: {e}")
-            
-        # Fallback data if extraction fails
-        if not probabilities:
-            probabilities = [
-                {
-                    'outcome': 'Hold (3.85%)',
-                    'rate': 3.85,
-                    'probability': 3,
-                    'impliedOdds': 33.33
-                },
-                {
-                    'outcome': '-0.25% (3.60%)',
-                    'rate': 3.60,
-                    'probability': 97,
-                    'impliedOdds': 1.03
-                }
-            ]
         
         return probabilities
     
@@ -194,8 +170,8 @@ class ASXSeleniumScraper:
         # Default to next known meeting
         return "2025-07-08"
 
-def save_data(data):
-    """Save data to JSON file"""
+def save_data(snapshot):
+    """Save snapshot to JSON file"""
     os.makedirs('data', exist_ok=True)
     
     filepath = 'data/market-odds.json'
@@ -207,8 +183,9 @@ def save_data(data):
     except:
         existing = {}
     
-    # Update with new data
-    existing.update(data)
+    # Update with new data (a fallback flag from a previous run must not linger)
+    existing.pop('fallback', None)
+    existing.update(snapshot.to_dict())
     
     # Save
     with open(filepath, 'w') as f:
@@ -226,7 +203,7 @@ def main():
     if data:
         save_data(data)
         print("Successfully fetched and saved data")
-        print(json.dumps(data, indent=2))
+        print(json.dumps(data.to_dict(), indent=2))
     else:
         print("Failed to fetch data")
         exit(1)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+RBA Market Odds Data Model
+Typed records shared by the scraper, the API proxy and the live fetcher
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the standard library
+    orjson = None
+
+# Probabilities are quoted in percent and rounded by the source, so allow a
+# little slack when checking that they add up
+PROBABILITY_TOTAL = 100.0
+PROBABILITY_TOLERANCE = 1.5
+
+# Source suffix used for canned data before snapshots carried a fallback flag
+FALLBACK_SOURCE_SUFFIX = '(Cached)'
+FALLBACK_SOURCE = f'ASX RBA Rate Tracker {FALLBACK_SOURCE_SUFFIX}'
+
+
+def dumps(data) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def implied_odds(probability: float) -> float:
+    """Decimal odds implied by a probability in percent (0 when impossible)"""
+    return round(100 / probability, 2) if probability > 0 else 0
+
+
+def _parse_iso(kind, value, name: str):
+    """Parse an ISO date or datetime string, raising ValueError if it is not one"""
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be an ISO string, got {value!r}")
+    try:
+        return kind.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value!r}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class Outcome:
+    """A single rate outcome and its market probability (in percent)"""
+    outcome: str
+    rate: float
+    probability: float
+    implied_odds: float = field(init=False)
+
+    def __post_init__(self):
+        if not 0 <= self.probability <= PROBABILITY_TOTAL:
+            raise ValueError(f"Probability out of range for {self.outcome!r}: {self.probability}")
+        if self.rate < 0:
+            raise ValueError(f"Negative rate for {self.outcome!r}: {self.rate}")
+        object.__setattr__(self, 'implied_odds', implied_odds(self.probability))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Outcome':
+        """Build an outcome from a market-odds.json probability entry"""
+        if data.get('outcome') is None:
+            raise ValueError(f"Outcome has no description: {data!r}")
+        return cls(
+            outcome=str(data['outcome']),
+            rate=float(data['rate']),
+            probability=float(data['probability'])
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'outcome': self.outcome,
+            'rate': self.rate,
+            'probability': self.probability,
+            'impliedOdds': self.implied_odds
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """
+    Market probabilities for the next meeting at a point in time
+    next_meeting (ISO date) and last_update (ISO datetime) keep their source
+    strings for serialisation; meeting_date and updated_at hold them parsed.
+    fallback marks canned data served when fetching failed, not market odds
+    """
+    next_meeting: str
+    source: str
+    last_update: str
+    probabilities: Tuple[Outcome, ...]
+    changes: Optional[Dict] = field(default=None, compare=False)
+    fallback: bool = False
+    meeting_date: date = field(init=False, repr=False, compare=False)
+    updated_at: datetime = field(init=False, repr=False, compare=False)
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'meeting_date', _parse_iso(date, self.next_meeting, 'nextMeeting'))
+        object.__setattr__(self, 'updated_at', _parse_iso(datetime, self.last_update, 'lastUpdate'))
+        object.__setattr__(self, 'probabilities', tuple(self.probabilities))
+        if not self.probabilities:
+            raise ValueError("Snapshot has no probabilities")
+        total = sum(p.probability for p in self.probabilities)
+        if abs(total - PROBABILITY_TOTAL) > PROBABILITY_TOLERANCE:
+            raise ValueError(f"Probabilities sum to {total}%, expected ~{PROBABILITY_TOTAL:g}%")
+
+    @classmethod
+    def create(cls, next_meeting: str, source: str, last_update: str,
+               probabilities: Iterable, changes: Optional[Dict] = None,
+               fallback: bool = False) -> 'Snapshot':
+        """Build a snapshot from Outcome records or raw probability dicts"""
+        outcomes = [p if isinstance(p, Outcome) else Outcome.from_dict(p) for p in probabilities]
+        return cls(next_meeting, source, last_update, tuple(outcomes), changes, fallback)
+
+    @classmethod
+    def create_fallback(cls, next_meeting: str, last_update: str) -> 'Snapshot':
+        """Build the canned snapshot served when fetching live odds fails"""
+        return cls.create(
+            next_meeting=next_meeting,
+            source=FALLBACK_SOURCE,
+            last_update=last_update,
+            probabilities=[
+                Outcome('Hold (3.85%)', 3.85, 3),
+                Outcome('-0.25% (3.60%)', 3.60, 97)
+            ],
+            fallback=True
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Snapshot':
+        """Build a snapshot from a market-odds.json style dict"""
+        source = data.get('source') or ''
+        if not isinstance(source, str):
+            raise ValueError(f"source must be a string, got {source!r}")
+        return cls.create(
+            next_meeting=data['nextMeeting'],
+            source=source,
+            last_update=data['lastUpdate'],
+            probabilities=data.get('probabilities', []),
+            changes=data.get('changes'),
+            fallback=data.get('fallback', source.endswith(FALLBACK_SOURCE_SUFFIX))
+        )
+
+    def to_dict(self) -> Dict:
+        data = {
+            'nextMeeting': self.next_meeting,
+            'source': self.source,
+            'lastUpdate': self.last_update,
+            'probabilities': [p.to_dict() for p in self.probabilities]
+        }
+        if self.changes is not None:
+            data['changes'] = self.changes
+        if self.fallback:
+            data['fallback'] = True
+        return data
+
+    def to_json(self) -> bytes:
+        """Compact JSON bytes for this snapshot, encoded once and then cached"""
+        if self._json is None:
+            object.__setattr__(self, '_json', dumps(self.to_dict()))
+        return self._json
+
+
+@dataclass(frozen=True, slots=True)
+class Meeting:
+    """A scheduled RBA board meeting (decision announcement time)"""
+    announced_at: datetime
+
+    @classmethod
+    def from_iso(cls, value: str) -> 'Meeting':
+        return cls(datetime.fromisoformat(value))
+
+    @property
+    def day(self) -> date:
+        return self.announced_at.date()
+
+    def to_iso(self) -> str:
+        return self.announced_at.isoformat()
+
+
+def parse_meetings(dates: Iterable[str]) -> List[Meeting]:
+    """Parse ISO announcement times into Meeting records sorted by time"""
+    return sorted((Meeting.from_iso(d) for d in dates), key=lambda m: m.announced_at)
+
+
+def load_meetings(data: Dict) -> List[Meeting]:
+    """Parse the dates of a meetings.json style dict into sorted Meeting records"""
+    return parse_meetings(data.get('dates', []))
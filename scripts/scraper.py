@@ -13,6 +13,8 @@ import os
 import sys
 from typing import Dict, List, Tuple
 
+from models import Outcome, Snapshot, parse_meetings
+
 # Configuration
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 TIMEZONE = pytz.timezone('Australia/Sydney')
@@ -26,7 +28,7 @@ def ensure_data_directory():
     if not os.path.exists(DATA_DIR):
         os.makedirs(DATA_DIR)
 
-def scrape_market_odds() -> Dict:
+def scrape_market_odds() -> Snapshot:
     """
     Scrape market probabilities from ASX RBA Rate Tracker
     Note: This is a simplified example - real implementation would need proper scraping
@@ -36,24 +38,17 @@ def scrape_market_odds() -> Dict:
     # In production, this would actually scrape the ASX website
     # For now, we'll simulate with mock data
     mock_probabilities = [
-        {"outcome": "Hold (4.35%)", "rate": 4.35, "probability": 45},
-        {"outcome": "-0.25% (4.10%)", "rate": 4.10, "probability": 40},
-        {"outcome": "-0.50% (3.85%)", "rate": 3.85, "probability": 15}
+        Outcome("Hold (4.35%)", 4.35, 45),
+        Outcome("-0.25% (4.10%)", 4.10, 40),
+        Outcome("-0.50% (3.85%)", 3.85, 15)
     ]
     
-    # Calculate implied odds
-    for prob in mock_probabilities:
-        if prob["probability"] > 0:
-            prob["impliedOdds"] = round(100 / prob["probability"], 2)
-        else:
-            prob["impliedOdds"] = 0
-    
-    return {
-        "nextMeeting": "2025-02-18",
-        "source": "ASX RBA Rate Tracker",
-        "lastUpdate": datetime.now(TIMEZONE).isoformat(),
-        "probabilities": mock_probabilities
-    }
+    return Snapshot.create(
+        next_meeting="2025-02-18",
+        source="ASX RBA Rate Tracker",
+        last_update=datetime.now(TIMEZONE).isoformat(),
+        probabilities=mock_probabilities
+    )
 
 def scrape_rate_history() -> Dict:
     """
@@ -103,7 +98,7 @@ def get_meeting_dates() -> Dict:
     print("Getting meeting dates...")
     
     # 2025 RBA meeting dates (would normally be scraped)
-    dates = [
+    meetings = parse_meetings([
         "2025-02-18T14:30:00+11:00",
         "2025-04-01T14:30:00+11:00",
         "2025-05-20T14:30:00+10:00",
@@ -112,13 +107,13 @@ def get_meeting_dates() -> Dict:
         "2025-09-30T14:30:00+10:00",
         "2025-11-18T14:30:00+11:00",
         "2025-12-16T14:30:00+11:00"
-    ]
+    ])
     
     return {
         "year": 2025,
         "source": "RBA Official Calendar",
         "timezone": "Australia/Sydney",
-        "dates": dates,
+        "dates": [m.to_iso() for m in meetings],
         "notes": "All meetings conclude at 2:30 PM local time with announcement"
     }
 
@@ -139,7 +134,7 @@ def main():
     try:
         # Scrape market odds
         market_data = scrape_market_odds()
-        save_json(market_data, 'market-odds.json')
+        save_json(market_data.to_dict(), 'market-odds.json')
         
         # Scrape rate history
         rate_history = scrape_rate_history()
@@ -0,0 +1,120 @@
+import argparse
+import json
+import math
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'scripts'))
+
+import backtest  # noqa: E402
+
+RATE_HISTORY = {
+    'lastChange': {'date': '2024-03-19', 'previousRate': 4.35, 'newRate': 4.10},
+    'historical': [{'date': '2024-01', 'rate': 4.35}, {'date': '2024-02', 'rate': 4.35}]
+}
+NO_CALENDAR = backtest.announcement_calendar([])
+AS_OF = pd.Timestamp('2025-01-01', tz='UTC')
+
+
+def make_batch(snapshots):
+    """Build an archive batch from (meeting date, [(rate, probability), ...]) pairs"""
+    rows = []
+    for snapshot_id, (meeting, outcomes) in enumerate(snapshots):
+        for rate, probability in outcomes:
+            rows.append({
+                'snapshot_id': snapshot_id,
+                'snapshot_time': pd.Timestamp('2024-02-01', tz='UTC'),
+                'meeting_date': pd.Timestamp(meeting),
+                'rate': rate,
+                'probability': probability
+            })
+    return pd.DataFrame(rows)
+
+
+def test_score_batch_listed_outcome():
+    batch = make_batch([('2024-02-06', [(4.35, 0.7), (4.10, 0.3)])])
+    snapshots, calibration = backtest.score_batch(batch, RATE_HISTORY, NO_CALENDAR, 10, AS_OF)
+
+    scored = snapshots.iloc[0]
+    assert scored['brier'] == pytest.approx(0.3 ** 2 + 0.3 ** 2)
+    assert scored['log_loss'] == pytest.approx(-math.log(0.7))
+    assert scored['hit'] == 1
+    # 2:30 PM AEDT on 6 Feb is 03:30 UTC
+    assert scored['days_before'] == pytest.approx(5 + 3.5 / 24)
+
+    assert calibration.loc[7, 'observed'] == 1 and calibration.loc[7, 'count'] == 1
+    assert calibration.loc[3, 'observed'] == 0 and calibration.loc[3, 'count'] == 1
+    assert calibration.loc[0, 'count'] == 0
+
+
+def test_score_batch_unlisted_outcome():
+    # The market gave the decided 4.10% no listed outcome at all
+    batch = make_batch([('2024-03-19', [(4.35, 1.0)])])
+    snapshots, calibration = backtest.score_batch(batch, RATE_HISTORY, NO_CALENDAR, 10, AS_OF)
+
+    scored = snapshots.iloc[0]
+    assert scored['brier'] == pytest.approx(2.0)
+    assert scored['log_loss'] == pytest.approx(-math.log(backtest.LOG_LOSS_EPSILON))
+    assert scored['hit'] == 0
+
+    assert calibration.loc[9, 'observed'] == 0 and calibration.loc[9, 'count'] == 1
+    assert calibration.loc[0, 'predicted'] == 0
+    assert calibration.loc[0, 'observed'] == 1 and calibration.loc[0, 'count'] == 1
+
+
+def test_resolve_decisions_stops_at_data_coverage():
+    meetings = pd.DatetimeIndex(['2024-02-06', '2024-03-19', '2024-05-07'])
+    announced = backtest.announcement_times(meetings, NO_CALENDAR)
+
+    decided = backtest.resolve_decisions(meetings, announced, RATE_HISTORY, AS_OF)
+    assert decided.iloc[0] == 4.35
+    assert decided.iloc[1] == 4.10
+    assert math.isnan(decided.iloc[2])
+
+    # Not decided until the announcement, even on the meeting day
+    morning = pd.Timestamp('2024-03-19 09:00', tz='Australia/Sydney')
+    assert math.isnan(backtest.resolve_decisions(meetings, announced, RATE_HISTORY, morning).iloc[1])
+
+
+def test_archive_skips_fallback_and_tracks_sources(tmp_path):
+    def write_snapshot(name, source):
+        with open(tmp_path / name, 'w') as f:
+            json.dump({
+                'nextMeeting': '2024-02-06',
+                'source': source,
+                'lastUpdate': '2024-02-01T10:00:00+11:00',
+                'probabilities': [{'outcome': 'Hold (4.35%)', 'rate': 4.35, 'probability': 100}]
+            }, f)
+
+    write_snapshot('prob_history_20240201.json', 'ASX RBA Rate Tracker')
+    write_snapshot('prob_history_20240202.json', 'ASX RBA Rate Tracker (Cached)')
+    archive_path = str(tmp_path / 'archive.parquet')
+
+    assert backtest.build_archive(archive_path, str(tmp_path)) == 1
+    assert not os.path.exists(archive_path + '.tmp')
+    assert not backtest.archive_is_stale(archive_path, str(tmp_path))
+
+    os.remove(tmp_path / 'prob_history_20240202.json')
+    assert backtest.archive_is_stale(archive_path, str(tmp_path))
+
+
+@pytest.mark.parametrize('bins', [0, -3])
+def test_bins_must_be_positive(bins):
+    with pytest.raises(ValueError):
+        backtest.run_backtest('unused.parquet', RATE_HISTORY, [], bins=bins)
+    with pytest.raises(argparse.ArgumentTypeError):
+        backtest._positive_int(str(bins))
+
+
+@pytest.mark.parametrize('outcomes', [
+    [(4.10, 0.5), (4.35, 0.5)],
+    [(4.35, 0.5), (4.10, 0.5)]
+])
+def test_tied_favourites_share_the_hit(outcomes):
+    batch = make_batch([('2024-02-06', outcomes)])
+    snapshots, _ = backtest.score_batch(batch, RATE_HISTORY, NO_CALENDAR, 10, AS_OF)
+
+    assert snapshots.iloc[0]['hit'] == pytest.approx(0.5)
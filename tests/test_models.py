@@ -0,0 +1,113 @@
+import dataclasses
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'scripts'))
+
+from models import Outcome, Snapshot  # noqa: E402
+
+MEETING = '2025-07-08'
+UPDATED = '2025-07-04T16:00:00+10:00'
+
+
+def make_snapshot(*probabilities, **kwargs):
+    outcomes = [Outcome(f'Outcome {i}', 3.85 - 0.25 * i, p) for i, p in enumerate(probabilities)]
+    return Snapshot.create(MEETING, 'ASX RBA Rate Tracker', UPDATED, outcomes, **kwargs)
+
+
+def test_outcome_implied_odds():
+    assert Outcome('Hold (3.85%)', 3.85, 3).implied_odds == 33.33
+    assert Outcome('-0.25% (3.60%)', 3.60, 97).implied_odds == 1.03
+    assert Outcome('-0.50% (3.35%)', 3.35, 0).implied_odds == 0
+
+
+@pytest.mark.parametrize('rate, probability', [(3.85, -1), (3.85, 100.5), (-0.25, 50)])
+def test_outcome_rejects_invalid_values(rate, probability):
+    with pytest.raises(ValueError):
+        Outcome('Hold', rate, probability)
+
+
+def test_outcome_from_dict_coerces_and_requires_description():
+    outcome = Outcome.from_dict({'outcome': 'Hold', 'rate': '3.85', 'probability': '40'})
+    assert outcome.rate == 3.85 and outcome.probability == 40.0
+
+    with pytest.raises(ValueError):
+        Outcome.from_dict({'outcome': None, 'rate': 3.85, 'probability': 40})
+
+
+def test_snapshot_probabilities_sum_to_about_100():
+    # Rounded source percentages are allowed a little slack
+    make_snapshot(33, 33, 33)
+    make_snapshot(50, 51.5)
+
+    with pytest.raises(ValueError):
+        make_snapshot(50, 48)
+    with pytest.raises(ValueError):
+        make_snapshot(60, 42)
+    with pytest.raises(ValueError):
+        make_snapshot()
+
+
+def test_snapshot_parses_dates():
+    snapshot = make_snapshot(100)
+    assert snapshot.meeting_date == date(2025, 7, 8)
+    assert snapshot.updated_at.isoformat() == UPDATED
+
+
+@pytest.mark.parametrize('next_meeting, last_update', [
+    ('x', UPDATED), (MEETING, 'z'), (None, UPDATED), (MEETING, None)
+])
+def test_snapshot_rejects_invalid_dates(next_meeting, last_update):
+    with pytest.raises(ValueError):
+        Snapshot.create(next_meeting, 'ASX RBA Rate Tracker', last_update, [Outcome('Hold', 3.85, 100)])
+
+
+def test_to_json_is_cached():
+    snapshot = make_snapshot(3, 97)
+    encoded = snapshot.to_json()
+    assert snapshot.to_json() is encoded
+    assert json.loads(encoded) == snapshot.to_dict()
+
+
+def test_replace_invalidates_cached_json():
+    snapshot = make_snapshot(3, 97)
+    snapshot.to_json()
+
+    changed = dataclasses.replace(snapshot, changes={'Hold': {'change': 1}})
+    assert json.loads(changed.to_json())['changes'] == {'Hold': {'change': 1}}
+    assert 'changes' not in json.loads(snapshot.to_json())
+
+
+def test_from_dict_round_trip():
+    snapshot = make_snapshot(3, 97, changes={'Hold': {'change': -2}})
+    assert Snapshot.from_dict(json.loads(snapshot.to_json())) == snapshot
+
+
+def test_fallback_flag():
+    fallback = Snapshot.create_fallback(MEETING, UPDATED)
+    assert fallback.fallback
+    assert json.loads(fallback.to_json())['fallback'] is True
+    assert 'fallback' not in make_snapshot(100).to_dict()
+
+
+def test_from_dict_infers_fallback_from_cached_source():
+    data = make_snapshot(3, 97).to_dict()
+    assert not Snapshot.from_dict(data).fallback
+
+    data['source'] = 'ASX RBA Rate Tracker (Cached)'
+    assert Snapshot.from_dict(data).fallback
+
+
+def test_from_dict_source_handling():
+    data = make_snapshot(100).to_dict()
+
+    data['source'] = None
+    assert Snapshot.from_dict(data).source == ''
+
+    data['source'] = 5
+    with pytest.raises(ValueError):
+        Snapshot.from_dict(data)